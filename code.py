@@ -1,11 +1,13 @@
-import time, random, math
+import time, random, math, struct
 import board, busio, displayio, terminalio
 from adafruit_display_text import label
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
 import adafruit_adxl34x
+from adafruit_bus_device.i2c_device import I2CDevice
 import neopixel
 import pwmio
+from micropython import const
 from rotary_encoder import RotaryEncoder
 
 DEBUG = True
@@ -21,11 +23,19 @@ ENC_B   = board.D0
 NEO_PIN = board.D1
 PIEZO_PIN = board.D2
 
+# ADXL345 raw data access (bypasses the driver's per-call scaling)
+ADXL_ADDR   = const(0x53)
+ADXL_DATAX0 = b"\x32"               # first of six X/Y/Z data registers
+ADXL_SCALE  = 0.004 * 9.80665        # m/s^2 per LSB (full resolution)
+
+ADXL_INT_SOURCE     = const(0x30)
+ADXL_INT_DATA_READY = const(0x80)
+
 # ============================================================================
 # GAME CONSTANTS
 # ============================================================================
-MAX_LEVELS = 10
-BASE_SCORE_PER_LEVEL = 100
+MAX_LEVELS = const(10)
+BASE_SCORE_PER_LEVEL = const(100)
 
 # NeoPixel color presets
 OFF    = (0,0,0)
@@ -48,13 +58,25 @@ ALL_MOVES = [
     MOVE_NOSE_DOWN
 ]
 
-# LED color for each gesture
-MOVE_COLORS = {
-    MOVE_BANK_LEFT:  (0, 0, 25),
-    MOVE_BANK_RIGHT: (0, 0, 25),
-    MOVE_NOSE_UP:    (0, 25, 0),
-    MOVE_NOSE_DOWN:  (25, 25, 0),
-}
+# Gesture indices into ALL_MOVES (TiltDetector.read returns these)
+IDX_BANK_LEFT  = const(0)
+IDX_BANK_RIGHT = const(1)
+IDX_NOSE_UP    = const(2)
+IDX_NOSE_DOWN  = const(3)
+
+# LED color for each gesture, aligned to ALL_MOVES indices
+MOVE_COLOR_ARRAY = (
+    (0, 0, 25),     # BANK LEFT
+    (0, 0, 25),     # BANK RIGHT
+    (0, 25, 0),     # NOSE UP
+    (25, 25, 0),    # NOSE DOWN
+)
+
+# Screen text templates (formatted only when a value changes)
+FMT_LEVEL = "LEVEL {}/{}"
+FMT_MOVE  = "DO: {}"
+FMT_TIME  = "Time: {:.1f}s"
+FMT_SCORE = "Score: {}"
 
 # Difficulty definitions
 DIFFICULTIES = [
@@ -64,19 +86,34 @@ DIFFICULTIES = [
 ]
 
 # ============================================================================
-# SOUND HELPER
+# MATH HELPER
 # ============================================================================
-def tone(pin, freq, duration, duty=45000):
+RAD2DEG = 57.29577951
+_PI_4   = math.pi / 4
+_3PI_4  = 3 * math.pi / 4
+
+def fast_atan2_deg(y, x):
     """
-    Simple piezo buzzer tone generator.
+    Polynomial atan2 approximation returning degrees (max error ~0.6°).
+    Much cheaper than math.atan2 on CircuitPython; plenty for gesture angles.
     """
-    try:
-        b = pwmio.PWMOut(pin, frequency=freq, duty_cycle=duty)
-        time.sleep(duration)
-        b.deinit()
-    except:
-        pass
-    time.sleep(0.01)
+    abs_y = abs(y) + 1e-10
+    if x >= 0:
+        r = (x - abs_y) / (x + abs_y)
+        angle = 0.1963*r*r*r - 0.9817*r + _PI_4
+    else:
+        r = (x + abs_y) / (abs_y - x)
+        angle = 0.1963*r*r*r - 0.9817*r + _3PI_4
+    if y < 0:
+        angle = -angle
+    return angle * RAD2DEG
+
+# Tilt trace output; only called under "if DEBUG:", so with DEBUG off no
+# angle is computed and no string is formatted
+def _tilt_dbg(t_roll, g_roll, t_pitch, g_pitch):
+    roll  = fast_atan2_deg(t_roll, g_roll)
+    pitch = fast_atan2_deg(t_pitch, g_pitch)
+    print(f"[TILT] Roll={roll:5.1f}°  Pitch={pitch:5.1f}°")
 
 # ============================================================================
 # DISPLAY WRAPPER
@@ -84,38 +121,64 @@ def tone(pin, freq, duration, duty=45000):
 class Display:
     """
     Cleaner OLED formatting helper. Handles 4-line screens.
+    The four labels are built once and their text is updated in place.
+    Auto-refresh is off: the panel is only pushed over I2C when a line
+    actually changed.
     """
     def __init__(self, disp):
         self.disp = disp
+        self.disp.auto_refresh = False
+        self._current = ["","","",""]
+        self._dirty = False
 
-    def show(self, l1="", l2="", l3="", l4=""):
         g = displayio.Group()
-        ys = [12,28,44,58]
-        ls = [l1,l2,l3,l4]
-
-        for i,txt in enumerate(ls):
-            if txt:
-                t = label.Label(
-                    terminalio.FONT,
-                    text=txt,
-                    color=0xFFFFFF,
-                    anchor_point=(0.5,0.5),
-                    anchored_position=(64, ys[i])
-                )
-                g.append(t)
+        self._labels = []
+        for y in (12,28,44,58):
+            t = label.Label(
+                terminalio.FONT,
+                text="",
+                color=0xFFFFFF,
+                anchor_point=(0.5,0.5),
+                anchored_position=(64, y)
+            )
+            g.append(t)
+            self._labels.append(t)
 
         self.disp.root_group = g
+        self.disp.refresh()
+
+    def _set(self, i, txt):
+        if txt != self._current[i]:
+            self._labels[i].text = txt
+            self._current[i] = txt
+            self._dirty = True
+
+    def _flush(self):
+        if self._dirty:
+            self.disp.refresh()
+            self._dirty = False
+
+    def show(self, l1="", l2="", l3="", l4=""):
+        self._set(0, l1)
+        self._set(1, l2)
+        self._set(2, l3)
+        self._set(3, l4)
+        self._flush()
 
     def show_ready(self, level):
         self.show(f"LEVEL {level}", "", "Center device…", "Stay still")
 
-    def show_level(self, level, move, remaining, score):
-        self.show(
-            f"LEVEL {level}/{MAX_LEVELS}",
-            f"DO: {move}",
-            f"Time: {remaining:.1f}s",
-            f"Score: {score}"
-        )
+    # Gameplay screen: static lines set once per level, then only the
+    # time line is rewritten as the clock ticks
+    # (no flush here: the first update_time pushes the whole screen at once)
+    def prepare_level(self, level, move, score):
+        self._set(0, FMT_LEVEL.format(level, MAX_LEVELS))
+        self._set(1, FMT_MOVE.format(move))
+        self._set(3, FMT_SCORE.format(score))
+
+    def update_time(self, remaining_tenths):
+        self._set(2, FMT_TIME.format(remaining_tenths/10))
+        self._flush()
 
     def show_difficulty(self, name, score):
         self.show(
@@ -132,11 +195,15 @@ class TiltDetector:
     """
     Handles ADXL345 calibration, filtering, angle extraction, categorizing
     roll/pitch movements into BANK LEFT/RIGHT or NOSE UP/DOWN gestures.
+    read() returns the gesture as an index into ALL_MOVES, or None.
     """
 
-    def __init__(self, accel):
+    def __init__(self, accel, i2c_device):
         self.acc = accel
-        self.alpha = 0.2  # smoothing filter alpha
+        self._i2c = i2c_device        # our own I2CDevice, used for burst reads
+        self._buf = bytearray(6)
+        self._cmd = bytearray(1)      # register address for single-byte reads
+        self.ema_shift = 2  # smoothing filter alpha = 1/2**ema_shift (0.25)
 
         # Gesture thresholds
         self.dead_angle   = 10.0
@@ -145,31 +212,63 @@ class TiltDetector:
         self.cross_limit  = 15.0
         self.samples_required = 2
 
-        # Debouncing
-        self._last_candidate = None
-        self._candidate_count = 0
+        # Debouncing: per-gesture bit history, fires when the low
+        # samples_required bits are all set
+        self._hist = [0,0,0,0]
+        self._mask = (1 << self.samples_required) - 1
 
         print("\n=== TILT CALIBRATION ===")
         time.sleep(1)
         self._calibrate()
 
-        # Initialize filtered values
-        self.xf, self.yf, self.zf = self.acc.acceleration
+        # Initialize filtered values (integer raw counts, see _update)
+        x,y,z = self._raw_xyz()
+        self.xf = x - self.x_off
+        self.yf = y - self.y_off
+        self.zf = z - self.z_off
+
+        # EMA accumulators hold out*(2**shift - 1) between updates
+        keep = (1 << self.ema_shift) - 1
+        self.ema_x = self.xf*keep
+        self.ema_y = self.yf*keep
+        self.ema_z = self.zf*keep
+
+    # ----------------------------------------------------------------------
+    # Single I2C burst read of the X/Y/Z data registers → raw signed counts
+    # (multiply by ADXL_SCALE for m/s^2)
+    # ----------------------------------------------------------------------
+    def _raw_xyz(self):
+        with self._i2c as d:
+            d.write_then_readinto(ADXL_DATAX0, self._buf)
+        return struct.unpack_from("<hhh", self._buf)
+
+    def _read_reg(self, reg):
+        self._cmd[0] = reg
+        with self._i2c as d:
+            d.write_then_readinto(self._cmd, self._buf, in_end=1)
+        return self._buf[0]
 
     # ----------------------------------------------------------------------
     # Calibration collects averages and figures out which axis is gravity
     # ----------------------------------------------------------------------
     def _calibrate(self):
-        samples = 50
+        shift = 6   # 64 samples, averaged with a shift instead of a divide
         sx=sy=sz=0
 
-        for _ in range(samples):
-            x,y,z = self.acc.acceleration
+        # Wait for a fresh sample each time (100 Hz output rate), so every
+        # read averages a distinct measurement rather than a repeated one.
+        # Bounded to 20ms: if DATA_READY never shows up this degrades to
+        # sleep-paced reads instead of hanging at boot.
+        for _ in range(1 << shift):
+            deadline = time.monotonic() + 0.02
+            while (not self._read_reg(ADXL_INT_SOURCE) & ADXL_INT_DATA_READY
+                   and time.monotonic() < deadline):
+                pass
+            x,y,z = self._raw_xyz()
             sx+=x; sy+=y; sz+=z
-            time.sleep(0.01)
 
-        ax=sx/samples; ay=sy/samples; az=sz/samples
-        print(f"Avg: X={ax:.2f} Y={ay:.2f} Z={az:.2f}")
+        ax=sx>>shift; ay=sy>>shift; az=sz>>shift
+        print(f"Avg: X={ax*ADXL_SCALE:.2f} Y={ay*ADXL_SCALE:.2f} Z={az*ADXL_SCALE:.2f}")
 
         mags = [abs(ax), abs(ay), abs(az)]
         self.gravity_axis = mags.index(max(mags))
@@ -181,87 +280,101 @@ class TiltDetector:
         self.y_off = ay if self.gravity_axis!=1 else 0
         self.z_off = az if self.gravity_axis!=2 else 0
 
-        # Determine which axes define roll/pitch
+        # Angle thresholds in tan-space: |atan2(t,g)| < a  <=>  |t| < tan(a)*g
+        self._tan_dead  = math.tan(math.radians(self.dead_angle))
+        self._tan_roll  = math.tan(math.radians(self.roll_thresh))
+        self._tan_pitch = math.tan(math.radians(self.pitch_thresh))
+        self._tan_cross = math.tan(math.radians(self.cross_limit))
+
+        # Bind the read() specialized for this gravity axis so the hot path
+        # never re-dispatches on the orientation
         if self.gravity_axis==2:
-            self.roll_plane=("X","Z")
-            self.pitch_plane=("Y","Z")
+            self.read = self._read_gravity_z
+            print("ROLL:  X/Z")
+            print("PITCH: Y/Z")
         elif self.gravity_axis==1:
-            self.roll_plane=("X","Y")
-            self.pitch_plane=("Z","Y")
+            self.read = self._read_gravity_y
+            print("ROLL:  X/Y")
+            print("PITCH: Z/Y")
         else:
-            self.roll_plane=("Y","X")
-            self.pitch_plane=("Z","X")
-
-        print(f"ROLL:  {self.roll_plane}")
-        print(f"PITCH: {self.pitch_plane}")
+            self.read = self._read_gravity_x
+            print("ROLL:  Y/X")
+            print("PITCH: Z/X")
 
     # ----------------------------------------------------------------------
     # Read + filter acceleration
+    # Fixed-point EMA: acc += x; out = acc >> k; acc -= out  (alpha = 1/2**k)
+    # Filtered values stay in raw sensor counts; roll/pitch only need ratios.
     # ----------------------------------------------------------------------
     def _update(self):
-        x,y,z = self.acc.acceleration
-        x -= self.x_off; y -= self.y_off; z -= self.z_off
-
-        a = self.alpha
-        self.xf = a*x + (1-a)*self.xf
-        self.yf = a*y + (1-a)*self.yf
-        self.zf = a*z + (1-a)*self.zf
+        x,y,z = self._raw_xyz()
+        xi = x - self.x_off
+        yi = y - self.y_off
+        zi = z - self.z_off
 
-    def _g(self, axis):
-        return {"X":self.xf, "Y":self.yf, "Z":self.zf}[axis]
+        k = self.ema_shift
+        self.ema_x += xi; self.xf = self.ema_x >> k; self.ema_x -= self.xf
+        self.ema_y += yi; self.yf = self.ema_y >> k; self.ema_y -= self.yf
+        self.ema_z += zi; self.zf = self.ema_z >> k; self.ema_z -= self.zf
 
     # ----------------------------------------------------------------------
-    # Convert filtered acceleration → roll/pitch angles → gesture detection
+    # read(): one of these is bound by _calibrate, hardcoding which filtered
+    # axes are tilt (numerator) and gravity (denominator) for roll/pitch
     # ----------------------------------------------------------------------
-    def read(self):
+    def _read_gravity_z(self):
         self._update()
+        return self._classify(self.xf, self.zf, self.yf, self.zf)
 
-        t_roll  = self._g(self.roll_plane[0])
-        g_roll  = self._g(self.roll_plane[1])
-        roll = math.degrees(math.atan2(t_roll, g_roll))
+    def _read_gravity_y(self):
+        self._update()
+        return self._classify(self.xf, self.yf, self.zf, self.yf)
 
-        t_pitch = self._g(self.pitch_plane[0])
-        g_pitch = self._g(self.pitch_plane[1])
-        pitch = math.degrees(math.atan2(t_pitch, g_pitch))
+    def _read_gravity_x(self):
+        self._update()
+        return self._classify(self.yf, self.xf, self.zf, self.xf)
 
+    # ----------------------------------------------------------------------
+    # Classify filtered acceleration → gesture detection
+    # Angle tests run on tilt/gravity ratios (atan is monotonic), so no
+    # angle is ever computed outside of DEBUG output.
+    # ----------------------------------------------------------------------
+    def _classify(self, t_roll, g_roll, t_pitch, g_pitch):
         if DEBUG:
-            print(f"[TILT] Roll={roll:5.1f}°  Pitch={pitch:5.1f}°")
+            _tilt_dbg(t_roll, g_roll, t_pitch, g_pitch)
+
+        abs_t_roll  = abs(t_roll)
+        abs_t_pitch = abs(t_pitch)
+
+        hist = self._hist
 
         # Neutral = no gesture
-        if abs(roll)<self.dead_angle and abs(pitch)<self.dead_angle:
-            self._last_candidate=None
-            self._candidate_count=0
+        if abs_t_roll<self._tan_dead*g_roll and abs_t_pitch<self._tan_dead*g_pitch:
+            hist[0] = hist[1] = hist[2] = hist[3] = 0
             return None
 
-        candidate=None
-
         # BANK gestures → dominated by roll
-        if abs(roll)>=self.roll_thresh and abs(pitch)<=self.cross_limit:
-            candidate = MOVE_BANK_RIGHT if roll>0 else MOVE_BANK_LEFT
+        if abs_t_roll>=self._tan_roll*g_roll and abs_t_pitch<=self._tan_cross*g_pitch:
+            ci = IDX_BANK_RIGHT if t_roll>0 else IDX_BANK_LEFT
 
         # NOSE gestures → dominated by pitch
-        elif abs(pitch)>=self.pitch_thresh and abs(roll)<=self.cross_limit:
-            candidate = MOVE_NOSE_DOWN if pitch>0 else MOVE_NOSE_UP
+        elif abs_t_pitch>=self._tan_pitch*g_pitch and abs_t_roll<=self._tan_cross*g_roll:
+            ci = IDX_NOSE_DOWN if t_pitch>0 else IDX_NOSE_UP
 
         # If not clean → no gesture
-        if candidate is None:
-            self._last_candidate=None
-            self._candidate_count=0
+        else:
+            hist[0] = hist[1] = hist[2] = hist[3] = 0
             return None
 
-        # Gesture debouncing
-        if candidate == self._last_candidate:
-            self._candidate_count += 1
-        else:
-            self._last_candidate = candidate
-            self._candidate_count = 1
+        # Gesture debouncing: shift this sample into the candidate's history,
+        # clear the others (a different candidate restarts the count)
+        h = ((hist[ci] << 1) | 1) & 0xFF
+        hist[0] = hist[1] = hist[2] = hist[3] = 0
 
         # Fire once stable
-        if self._candidate_count >= self.samples_required:
-            self._last_candidate=None
-            self._candidate_count=0
-            return candidate
+        if h & self._mask == self._mask:
+            return ci
 
+        hist[ci] = h
         return None
 
 # ============================================================================
@@ -285,24 +398,52 @@ class StarRun:
         self.disp = Display(oled)
 
         # ----- Accelerometer -----
-        accel = adafruit_adxl34x.ADXL345(i2c)
-        self.tilt = TiltDetector(accel)
+        # The driver powers up and configures the sensor; raw reads go
+        # through a separate I2CDevice on the same address
+        accel = adafruit_adxl34x.ADXL345(i2c, address=ADXL_ADDR)
+        self.tilt = TiltDetector(accel, I2CDevice(i2c, ADXL_ADDR))
 
         # ----- Encoder -----
         self.enc = RotaryEncoder(ENC_A, ENC_B, debounce_ms=3, pulses_per_detent=3)
 
         # ----- LED + Piezo -----
         self.pixel = neopixel.NeoPixel(NEO_PIN, 1, brightness=0.3, auto_write=False)
-        self.piezo = PIEZO_PIN
+        try:
+            self._pwm = pwmio.PWMOut(PIEZO_PIN, frequency=440, duty_cycle=0, variable_frequency=True)
+        except Exception:
+            self._pwm = None   # no piezo: beep() stays silent
+        self._last_px = None   # last color pushed to the NeoPixel
 
         # ----- Game State -----
-        self.diff_idx = 0
+        self._apply_difficulty(0)
         self.score = 0
 
-    # Short helper
+    # Select a difficulty and precompute what only depends on it:
+    # per-level time limits and the score for clearing a level
+    def _apply_difficulty(self, idx):
+        self.diff_idx = idx
+        d = DIFFICULTIES[idx]
+        self._time_limits = tuple(
+            max(0.9, d["base_time"] - d["per_level"]*i) for i in range(MAX_LEVELS)
+        )
+        self._earned_per_level = BASE_SCORE_PER_LEVEL + d["score_bonus"]
+
+    # Piezo tone on the persistent PWM channel (silent at duty 0)
+    def beep(self, freq, duration, duty=45000):
+        if self._pwm is not None:
+            self._pwm.frequency = freq
+            self._pwm.duty_cycle = duty
+            time.sleep(duration)
+            self._pwm.duty_cycle = 0
+        time.sleep(0.01)   # short gap between notes
+
+    # Short helper (skips the wire write when the color is unchanged)
     def px(self, c):
+        if c == self._last_px:
+            return
         self.pixel[0] = c
         self.pixel.show()
+        self._last_px = c
 
     # ----------------------------------------------------------------------
     # Neutral detection (device resting)
@@ -324,16 +465,20 @@ class StarRun:
             time.sleep(0.02)
 
     # ----------------------------------------------------------------------
-    # Wait for encoder twist
+    # Wait for encoder twist; tick_callback(now) runs every poll so the
+    # caller can animate while waiting
     # ----------------------------------------------------------------------
-    def wait_for_rotate(self):
+    def wait_for_rotate(self, tick_callback=None):
         last=self.enc.position
         while True:
+            now = time.monotonic()
+            if tick_callback:
+                tick_callback(now)
             if self.enc.update():
                 if self.enc.position != last:
-                    tone(self.piezo,700,0.07)
+                    self.beep(700,0.07)
                     return
-            time.sleep(0.03)
+            time.sleep(max(0, 0.02 - (time.monotonic() - now)))
 
     # ----------------------------------------------------------------------
     # Difficulty Selection Screen
@@ -342,51 +487,63 @@ class StarRun:
         idx = self.diff_idx
         idle = time.monotonic()
         last_step = time.monotonic()   # anti-bounce UI-level timing
+        shown_idx = -1                 # redraw only when selection changes
+        shown_blink = -1               # LED only rewritten when blink flips
+
+        # Local aliases for the loop (LOAD_FAST instead of global/attr lookups)
+        monotonic = time.monotonic
+        sleep = time.sleep
+        px = self.px
+        enc = self.enc
+        off = OFF
+        flying = FLYING
 
         while True:
-            d = DIFFICULTIES[idx]
-            self.disp.show_difficulty(d["name"], self.score)
-            self.px(FLYING if int(time.monotonic()*2)%2 == 0 else OFF)
+            now = monotonic()
+
+            if idx != shown_idx:
+                self.disp.show_difficulty(DIFFICULTIES[idx]["name"], self.score)
+                shown_idx = idx
+
+            blink_phase = int(now*2) & 1
+            if blink_phase != shown_blink:
+                px(off if blink_phase else flying)
+                shown_blink = blink_phase
 
             # ---- READ ROTARY USING SAFE DELTA MODE ----
-            if self.enc.update():  
-                delta = self.enc.get_delta()   # MUCH more reliable than position math
+            if enc.update():  
+                delta = enc.get_delta()   # MUCH more reliable than position math
 
                 # only allow change every 150ms to prevent multi-jumps
-                if delta != 0 and (time.monotonic() - last_step) > 0.15:
+                if delta != 0 and (now - last_step) > 0.15:
                     if delta > 0:
                         idx = (idx + 1) % len(DIFFICULTIES)
                     else:
                         idx = (idx - 1) % len(DIFFICULTIES)
 
-                    last_step = time.monotonic()
-                    idle = time.monotonic()
-                    tone(self.piezo, 800, 0.05)
+                    last_step = now
+                    idle = now
+                    self.beep(800, 0.05)
 
             # ---- Idle timeout to select difficulty ----
-            if time.monotonic() - idle > self.DIFFICULTY_IDLE_TIMEOUT:
-                self.diff_idx = idx
+            if now - idle > self.DIFFICULTY_IDLE_TIMEOUT:
+                self._apply_difficulty(idx)
                 return
 
-            time.sleep(0.02)
-
-
-            # NEW: 6 seconds instead of 2
-            if time.monotonic() - idle > self.DIFFICULTY_IDLE_TIMEOUT:
-                self.diff_idx = idx
-                return
-        
-            time.sleep(0.05)
+            # Hold a 20ms frame budget regardless of how long this frame took
+            # (the encoder used to be polled every ~70ms: 20ms + 50ms sleeps)
+            sleep(max(0, 0.02 - (monotonic() - now)))
 
     # ----------------------------------------------------------------------
     # Level gameplay
     # ----------------------------------------------------------------------
     def play_level(self, lvl):
-        move = random.choice(ALL_MOVES)
-        d = DIFFICULTIES[self.diff_idx]
+        move_idx = self._level_moves[lvl-1]
+        move = ALL_MOVES[move_idx]
+        color = MOVE_COLOR_ARRAY[move_idx]
 
-        # Calculate allowed time for this level
-        time_limit = max(0.9, d["base_time"] - d["per_level"]*(lvl-1))
+        # Allowed time for this level (precomputed by select_difficulty)
+        time_limit = self._time_limits[lvl-1]
 
         print(f"\n=== LEVEL {lvl} — NEED {move} ===")
 
@@ -397,43 +554,55 @@ class StarRun:
         self.px(OFF)
         time.sleep(0.25)
 
+        # Local aliases for the loop (LOAD_FAST instead of global/attr lookups)
+        monotonic = time.monotonic
+        sleep = time.sleep
+        px = self.px
+        read = self.tilt.read
+        update_time = self.disp.update_time
+
         # Start timer
-        start = time.monotonic()
+        self.disp.prepare_level(lvl, move, self.score)
+        start = monotonic()
+        prev_tenths = -1   # redraw only when the 0.1s clock ticks
 
         # Actual gameplay loop
         while True:
-            now = time.monotonic()
-            remaining = time_limit - (now - start)
+            remaining = time_limit - (monotonic() - start)
 
             if remaining <= 0:
                 print("TIMEOUT")
                 return False
 
-            # Show move during gameplay
-            self.disp.show_level(lvl, move, remaining, self.score)
-            self.px(MOVE_COLORS[move])
+            # Show move during gameplay (strings only built on a tenths change).
+            # Round up so the first frame shows the full limit (6.0, not 5.9)
+            rem_tenths = -int(-remaining * 10)
+            if rem_tenths != prev_tenths:
+                update_time(rem_tenths)
+                prev_tenths = rem_tenths
+            px(color)
 
-            g = self.tilt.read()
-            if g:
-                print("GESTURE:", g)
+            g = read()
+            if g is not None:
+                print("GESTURE:", ALL_MOVES[g])
 
                 # Correct move
-                if g == move:
-                    earned = BASE_SCORE_PER_LEVEL + d["score_bonus"]
+                if g == move_idx:
+                    earned = self._earned_per_level
                     self.score += earned
                     print("SUCCESS +", earned)
                     self.px(GOOD)
-                    tone(self.piezo,900,0.1)
+                    self.beep(900,0.1)
                     return True
 
                 # Wrong gesture
                 else:
                     print("WRONG")
                     self.px(BAD)
-                    tone(self.piezo,200,0.3)
+                    self.beep(200,0.3)
                     return False
 
-            time.sleep(0.02)
+            sleep(0.02)
 
     # ----------------------------------------------------------------------
     # Main Loop
@@ -447,7 +616,16 @@ class StarRun:
             self.select_difficulty()
 
             self.disp.show("STAR RUN","","Rotate to Start","")
-            self.wait_for_rotate()
+            self.wait_for_rotate(lambda now: self.px(OFF if int(now*2) & 1 else FLYING))
+
+            # ==== Pick this game's moves up front ====
+            # Fisher-Yates over 3 copies of each move (CircuitPython's random
+            # has no shuffle), keeping the first MAX_LEVELS
+            order = list(range(len(ALL_MOVES))) * 3
+            for i in range(len(order)-1, 0, -1):
+                j = random.randrange(i+1)
+                order[i], order[j] = order[j], order[i]
+            self._level_moves = order[:MAX_LEVELS]
 
             # ==== Play levels ====
             won=True
@@ -460,16 +638,16 @@ class StarRun:
             if won:
                 self.px(WIN)
                 self.disp.show("YOU WIN!", f"Score:{self.score}", "", "Rotate to restart")
-                tone(self.piezo,523,0.1); time.sleep(0.05)
-                tone(self.piezo,659,0.1); time.sleep(0.05)
-                tone(self.piezo,784,0.2)
+                self.beep(523,0.1); time.sleep(0.05)
+                self.beep(659,0.1); time.sleep(0.05)
+                self.beep(784,0.2)
 
                 time.sleep(self.END_SCREEN_DELAY)  # ← NEW 3s pause
 
             else:
                 self.px(BAD)
                 self.disp.show("GAME OVER", f"Score:{self.score}", "", "Rotate to retry")
-                tone(self.piezo,200,0.3)
+                self.beep(200,0.3)
                 self.score = 0
 
                 time.sleep(self.END_SCREEN_DELAY)  # ← NEW 3s pause